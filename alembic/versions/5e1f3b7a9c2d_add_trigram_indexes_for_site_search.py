@@ -0,0 +1,43 @@
+"""Add trigram indexes for site search
+
+Revision ID: 5e1f3b7a9c2d
+Revises: c9a6a41b34e5
+Create Date: 2025-07-21 10:12:41.218374
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1f3b7a9c2d"
+down_revision: Union[str, None] = "c9a6a41b34e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Site search filters with ILIKE '%term%' on name and url, which a B-tree
+    # index cannot serve; trigram GIN indexes can
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_sites_name_trgm",
+        "sites",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_sites_url_trgm",
+        "sites",
+        ["url"],
+        postgresql_using="gin",
+        postgresql_ops={"url": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    op.drop_index("ix_sites_url_trgm", "sites")
+    op.drop_index("ix_sites_name_trgm", "sites")
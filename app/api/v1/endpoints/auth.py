@@ -118,16 +118,16 @@ async def register(
     # Assign org_admin role to the user who creates the organization
     from app.models.role import Role, UserRole
     
-    # Get org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
+    # Get org_admin role id; only the key is needed for the assignment
+    org_admin_role_id = await db.scalar(
+        select(Role.id).where(Role.name == "org_admin")
+    )
     
-    if org_admin_role:
+    if org_admin_role_id is not None:
         # Create user role assignment
         user_role = UserRole.assign_role(
             user_id=user.id,
-            role_id=org_admin_role.id,
+            role_id=org_admin_role_id,
             organization_id=organization.id,
             assigned_by_id=user.id  # Self-assigned during registration
         )
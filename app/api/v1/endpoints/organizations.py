@@ -158,16 +158,16 @@ async def create_organization(
     # Assign org_admin role to the creator in this organization
     from app.models.role import Role, UserRole
     
-    # Get org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
+    # Get org_admin role id; only the key is needed for the assignment
+    org_admin_role_id = await db.scalar(
+        select(Role.id).where(Role.name == "org_admin")
+    )
     
-    if org_admin_role:
+    if org_admin_role_id is not None:
         # Create user role assignment
         user_role = UserRole.assign_role(
             user_id=current_user.id,
-            role_id=org_admin_role.id,
+            role_id=org_admin_role_id,
             organization_id=organization.id,
             assigned_by_id=current_user.id  # Self-assigned
         )
@@ -567,10 +567,17 @@ async def set_default_organization(
             detail="You don't belong to this organization"
         )
     
-    # First, unset all default organizations for this user
+    # First, unset the user's current default. Only that row is rewritten (and
+    # locked); this must stay a separate statement because uq_user_default_org
+    # is checked row by row and would reject a single UPDATE that sets the new
+    # default before clearing the old one
     unset_query = (
         update(user_organization)
-        .where(user_organization.c.user_id == current_user.id)
+        .where(
+            user_organization.c.user_id == current_user.id,
+            user_organization.c.is_default,
+            user_organization.c.organization_id != organization_id
+        )
         .values(is_default=False)
     )
     await db.execute(unset_query)
@@ -649,10 +656,14 @@ async def set_default_organization_by_uuid(
             detail="You don't belong to this organization"
         )
     
-    # First, unset all default organizations for this user
+    # First, unset the user's current default (see set_default_organization)
     unset_query = (
         update(user_organization)
-        .where(user_organization.c.user_id == current_user.id)
+        .where(
+            user_organization.c.user_id == current_user.id,
+            user_organization.c.is_default,
+            user_organization.c.organization_id != organization.id
+        )
         .values(is_default=False)
     )
     await db.execute(unset_query)
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -152,6 +152,32 @@ async def create_module(
     return db_module
 
 
+async def bulk_create_modules(
+    db: AsyncSession, modules: List[ModuleCreate], created_by: int
+) -> List[int]:
+    """Create several modules with one INSERT and return their IDs in order.
+
+    This does not commit; the caller commits the batch.
+    """
+    result = await db.execute(
+        insert(Module).returning(Module.id, sort_by_parameter_order=True),
+        [
+            {
+                "machine_name": module.machine_name,
+                "display_name": module.display_name,
+                "drupal_org_link": (
+                    str(module.drupal_org_link) if module.drupal_org_link else None
+                ),
+                "module_type": module.module_type,
+                "created_by": created_by,
+                "updated_by": created_by,
+            }
+            for module in modules
+        ],
+    )
+    return list(result.scalars())
+
+
 async def update_module(
     db: AsyncSession, module_id: int, module_update: ModuleUpdate, updated_by: int
 ) -> Optional[Module]:
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -146,6 +146,38 @@ async def create_module_version(
     return db_version
 
 
+async def bulk_create_module_versions(
+    db: AsyncSession, versions: List[ModuleVersionCreate], created_by: int
+) -> List[int]:
+    """Create several module versions with one INSERT and return their IDs in order.
+
+    This does not commit; the caller commits the batch.
+    """
+    result = await db.execute(
+        insert(ModuleVersion).returning(
+            ModuleVersion.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "module_id": version.module_id,
+                "version_string": version.version_string,
+                "release_date": version.release_date,
+                "is_security_update": version.is_security_update,
+                "release_notes": version.release_notes,
+                "drupal_core_compatibility": (
+                    ",".join(version.drupal_core_compatibility)
+                    if version.drupal_core_compatibility
+                    else None
+                ),
+                "created_by": created_by,
+                "updated_by": created_by,
+            }
+            for version in versions
+        ],
+    )
+    return list(result.scalars())
+
+
 async def update_module_version(
     db: AsyncSession,
     version_id: int,
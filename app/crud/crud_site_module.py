@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -45,6 +45,7 @@ async def get_site_modules(
     updates_only: bool = False,
     security_only: bool = False,
     enabled_only: bool = True,
+    include_deleted: bool = False,
 ) -> tuple[List[SiteModule], int]:
     """Get all modules for a specific site with filtering."""
 
@@ -57,13 +58,18 @@ async def get_site_modules(
             joinedload(SiteModule.latest_version),
             joinedload(SiteModule.site),
         )
-        .filter(SiteModule.site_id == site_id, ~SiteModule.is_deleted)
+        .filter(SiteModule.site_id == site_id)
     )
 
     count_query = select(func.count(SiteModule.id)).filter(
-        SiteModule.site_id == site_id, ~SiteModule.is_deleted
+        SiteModule.site_id == site_id
     )
 
+    # Apply soft-delete filter
+    if not include_deleted:
+        query = query.filter(~SiteModule.is_deleted)
+        count_query = count_query.filter(~SiteModule.is_deleted)
+
     # Apply enabled filter
     if enabled_only:
         query = query.filter(SiteModule.enabled)
@@ -156,6 +162,32 @@ async def create_site_module(
     return db_site_module
 
 
+async def bulk_create_site_modules(
+    db: AsyncSession, site_modules: List[SiteModuleCreate], created_by: int
+) -> List[int]:
+    """Create several site modules with one INSERT and return their IDs in order.
+
+    This does not commit; the caller commits the batch. Unlike create_site_module
+    it leaves the availability flags unset; call update_site_module_availability
+    for rows whose module has newer versions.
+    """
+    result = await db.execute(
+        insert(SiteModule).returning(SiteModule.id, sort_by_parameter_order=True),
+        [
+            {
+                "site_id": site_module.site_id,
+                "module_id": site_module.module_id,
+                "current_version_id": site_module.current_version_id,
+                "enabled": site_module.enabled,
+                "created_by": created_by,
+                "updated_by": created_by,
+            }
+            for site_module in site_modules
+        ],
+    )
+    return list(result.scalars())
+
+
 async def update_site_module(
     db: AsyncSession,
     site_id: int,
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, Table
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, Table, text
 
 from app.models.base import Base
 
@@ -11,4 +11,11 @@ user_organization = Table(
         "organization_id", Integer, ForeignKey("organizations.id"), primary_key=True
     ),
     Column("is_default", Boolean, default=False, nullable=False),
+    # At most one default organization per user (migration 439a847c88cc)
+    Index(
+        "uq_user_default_org",
+        "user_id",
+        unique=True,
+        postgresql_where=text("is_default = true"),
+    ),
 )
@@ -0,0 +1,22 @@
+"""
+Shared test credentials.
+
+Fixtures and helpers import the precomputed hashes from here instead of
+hashing the same password in every module.
+"""
+
+from app.core import security
+from app.core.security import get_password_hash
+
+# Tests need valid bcrypt hashes, not strong ones. The minimum cost makes each
+# hash/verify ~256x cheaper than the production default of 12 rounds.
+security.pwd_context.update(bcrypt__rounds=4)
+
+TEST_USER_PASSWORD = "test123"
+TEST_SUPERUSER_PASSWORD = "admin123"
+
+# Hash the fixture passwords once per session rather than once per created user.
+# Tests only need a hash that verifies; endpoints such as /auth/register still
+# run the real hasher.
+TEST_USER_PASSWORD_HASH = get_password_hash(TEST_USER_PASSWORD)
+TEST_SUPERUSER_PASSWORD_HASH = get_password_hash(TEST_SUPERUSER_PASSWORD)
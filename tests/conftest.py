@@ -1,14 +1,14 @@
 import asyncio
 import os
 import time
+from datetime import timedelta
 from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import select, text
 
 from app.core.config import settings
@@ -16,7 +16,9 @@ from app.core.security import create_access_token, get_password_hash
 from app.db.base_class import Base
 from app.db.session import get_db
 from app.models.organization import Organization
+from app.models.role import Role
 from app.models.user import User
+from tests._passwords import TEST_SUPERUSER_PASSWORD_HASH, TEST_USER_PASSWORD_HASH
 
 
 # Test database URL - dynamically determine based on environment
@@ -41,38 +43,89 @@ def get_test_database_url():
         )
 
 
-# Create async engine for tests - moved to test_engine fixture for proper URL
-# Global engine is not needed as we use the fixture
+def get_test_schema():
+    """Get the schema that isolates this pytest-xdist worker, if any."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"test_{worker}" if worker else None
 
-# Create async session factory - will be created in fixtures using test engine
-_ = None  # Defined in fixtures
 
+# Roles and permissions are seeded by migration b2ea20bcef20 into the migrated
+# (public) tables. A worker schema gets fresh, empty RBAC tables from
+# create_all that shadow public on the search_path, so the seed rows are
+# copied over, keeping their ids.
+RBAC_SEED_COPIES = (
+    ("permissions", "id, name, resource, action, description"),
+    ("roles", "id, name, display_name, description, is_system"),
+    ("role_permissions", "role_id, permission_id"),
+)
 
-@pytest.fixture(scope="function")
-def event_loop():
-    """Create an instance of the default event loop for each test case."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
-    asyncio.set_event_loop(None)
+
+async def seed_worker_rbac(conn: AsyncConnection, schema: str) -> None:
+    """Copy the migration-seeded RBAC rows from public into a worker schema."""
+    for table, columns in RBAC_SEED_COPIES:
+        await conn.execute(
+            text(
+                f'INSERT INTO "{schema}".{table} ({columns}) '
+                f"SELECT {columns} FROM public.{table}"
+            )
+        )
+    # Rows were inserted with explicit ids; move the sequences past them
+    for table in ("permissions", "roles"):
+        await conn.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('\"{schema}\".{table}', 'id'), "
+                f'COALESCE((SELECT MAX(id) FROM "{schema}".{table}), 0) + 1, false)'
+            )
+        )
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop.
+
+    Async fixtures already default to the session loop
+    (``asyncio_default_fixture_loop_scope`` in pytest.ini). Tests must share
+    that loop too, because the engine pool and the client are created on it.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest_asyncio.fixture(scope="session")
 async def test_engine():
     """Create a test engine and initialize the database with a superuser."""
+    # Under pytest-xdist each worker gets its own schema so parallel workers
+    # never contend for the same rows or unique keys
+    schema = get_test_schema()
+    # public stays on the path for shared extensions such as pg_trgm
+    connect_args = (
+        {"server_settings": {"search_path": f"{schema},public"}} if schema else {}
+    )
     engine = create_async_engine(
         get_test_database_url(),
         echo=True,
         future=True,
         isolation_level="READ COMMITTED",
-        poolclass=NullPool,  # Use NullPool to avoid connection reuse
+        # Fixtures and tests all run on the session event loop (see
+        # pytest_collection_modifyitems), so pooled connections can be reused
+        # instead of reconnecting for each test
+        pool_size=5,
+        connect_args=connect_args,
     )
 
     # Create tables at the start of the test session
     async with engine.begin() as conn:
+        if schema:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+        # Site search uses trigram GIN indexes; the extension lives in public so
+        # every worker schema sees it and dropping a worker schema keeps it
+        await conn.execute(
+            text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public")
+        )
         await conn.run_sync(Base.metadata.create_all)
+        if schema:
+            await seed_worker_rbac(conn, schema)
 
     # Create a session to add the superuser
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -100,93 +153,72 @@ async def test_engine():
     # Drop tables at the end of the test session
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        if schema:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
     await engine.dispose()
 
 
 @pytest.fixture
-async def db_session(test_engine) -> AsyncSession:
-    """Create a clean database session for each test.
-
-    This fixture ensures that each test starts with a clean database by:
-    1. Creating a new session
-    2. Preserving the superuser account
-    3. Deleting all other data from tables in the correct order to handle foreign keys
-    4. Yielding the session for test use
-    5. Rolling back and closing the session after test
-    """
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        # First, get the superuser email from settings
-        superuser_email = settings.SUPERUSER_EMAIL
-
-        # Get the superuser's ID to preserve
-        query = select(User).where(User.email == superuser_email)
-        result = await session.execute(query)
-        superuser = result.scalar_one_or_none()
-        superuser_id = superuser.id if superuser else None
-
-        # Delete all data from tables in correct order to handle foreign keys
-        # First, remove all associations
-        await session.execute(text("DELETE FROM user_organizations"))
-        await session.execute(text("DELETE FROM site_modules"))
-        await session.execute(text("DELETE FROM user_roles"))  # Clean up RBAC assignments
-        
-        # Clear ALL foreign key references before deleting anything
-        await session.execute(text("UPDATE sites SET created_by = NULL, updated_by = NULL"))
-        await session.execute(text("UPDATE modules SET created_by = NULL, updated_by = NULL"))
-        await session.execute(text("UPDATE module_versions SET created_by = NULL, updated_by = NULL"))
-        await session.execute(text("UPDATE organizations SET created_by = NULL, updated_by = NULL"))
-        await session.execute(text("UPDATE users SET organization_id = NULL"))
-        await session.commit()  # Commit all the nullifications
-        
-        # Now delete in reverse dependency order
-        await session.execute(text("DELETE FROM sites"))
-        await session.execute(text("DELETE FROM module_versions"))
-        await session.execute(text("DELETE FROM modules"))
-        
-        # Delete all users except superuser
-        if superuser_id:
-            await session.execute(text(f"DELETE FROM users WHERE id != {superuser_id}"))
-        else:
-            await session.execute(text("DELETE FROM users"))
-        
-        # Finally delete organizations (after users since we cleared the FKs)
-        await session.execute(text("DELETE FROM organizations"))
-        await session.commit()
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open a connection whose outer transaction is rolled back after the test.
 
+    Every session a test uses, including the ones created for API requests,
+    joins this transaction through SAVEPOINTs. ``commit()`` therefore only
+    releases a savepoint, and nothing a test writes outlives it, so the
+    tables never need to be cleaned between tests.
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
         try:
-            yield session
+            yield connection
         finally:
-            # Don't rollback here as it would undo committed fixture data
-            await session.close()
+            await transaction.rollback()
 
 
-@pytest.fixture(scope="function")
-async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with proper session management."""
+@pytest.fixture
+async def db_session(db_connection: AsyncConnection) -> AsyncSession:
+    """Create a database session joined to the per-test transaction."""
+    async with AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
+        yield session
 
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        # Create a new session for each API request
-        async_session = sessionmaker(
-            test_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with async_session() as session:
-            try:
-                yield session
-                await session.commit()  # Commit the transaction if no exceptions occurred
-            except Exception:
-                await session.rollback()  # Rollback in case of exceptions
-                raise
-            finally:
-                await session.close()
+
+@pytest.fixture
+def override_get_db(db_connection: AsyncConnection):
+    """Route the app's ``get_db`` dependency through the per-test transaction."""
+    # API requests share the test's connection, so their sessions (and the
+    # SAVEPOINTs they open) must not interleave when requests run concurrently
+    request_lock = asyncio.Lock()
+
+    async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with request_lock:
+            async with AsyncSession(
+                bind=db_connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            ) as session:
+                try:
+                    yield session
+                    await session.commit()  # Releases this request's savepoint
+                except Exception:
+                    await session.rollback()  # Only undoes this request's work
+                    raise
 
     # Import the main app with all middleware
     from app.main import app as main_app
 
-    main_app.dependency_overrides[get_db] = override_get_db
+    main_app.dependency_overrides[get_db] = _override_get_db
+    yield _override_get_db
+    main_app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create the test client once; the ASGI transport needs no network setup."""
+    from app.main import app as main_app
 
     async with AsyncClient(
         transport=ASGITransport(app=main_app),
@@ -196,6 +228,15 @@ async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
 
+@pytest.fixture
+def client(override_get_db, session_client: AsyncClient) -> AsyncClient:
+    """Return the shared test client with requests bound to this test's transaction.
+
+    Tests pass credentials per request, so nothing on the client carries over.
+    """
+    return session_client
+
+
 @pytest.fixture
 async def test_user(request, db_session: AsyncSession) -> User:
     """Create a test user with a unique email."""
@@ -208,7 +249,7 @@ async def test_user(request, db_session: AsyncSession) -> User:
 
     user = User(
         email=email,
-        hashed_password=get_password_hash("test123"),
+        hashed_password=TEST_USER_PASSWORD_HASH,
         is_active=True,
         role="user",
     )
@@ -231,7 +272,7 @@ async def test_superuser(request, db_session: AsyncSession) -> User:
     
     user = User(
         email=email,
-        hashed_password=get_password_hash("admin123"),
+        hashed_password=TEST_SUPERUSER_PASSWORD_HASH,
         is_active=True,
         is_superuser=True,
         role="superuser",
@@ -253,8 +294,9 @@ async def test_organization(db_session: AsyncSession, test_user: User) -> Organi
         is_deleted=False,
     )
     db_session.add(org)
+    # Every column is set client-side and the id comes back from the INSERT,
+    # so no refresh SELECT is needed
     await db_session.commit()
-    await db_session.refresh(org)
     return org
 
 
@@ -275,9 +317,7 @@ async def test_site(
         is_deleted=False,
     )
     db_session.add(site)
-    await db_session.flush()  # Ensure the site is written to the database
-    await db_session.commit()
-    await db_session.refresh(site)
+    await db_session.commit()  # No refresh: Site has no server-side defaults
     return site
 
 
@@ -288,13 +328,37 @@ def user_token_headers(test_user: User) -> dict:
     return {"Authorization": f"Bearer {access_token}"}
 
 
-@pytest.fixture
-async def superuser_token_headers(test_superuser: User) -> dict:
-    """Create authorization headers with superuser JWT token."""
-    access_token = create_access_token(data={"sub": test_superuser.email})
+@pytest.fixture(scope="session")
+def superuser_token_headers(test_engine) -> dict:
+    """Create authorization headers for the session-wide superuser.
+
+    The superuser is committed once by ``test_engine`` outside the per-test
+    transaction, so the token is signed once and stays valid for the whole
+    run; the expiry is extended so long sessions don't outlive it.
+    """
+    access_token = create_access_token(
+        data={"sub": settings.SUPERUSER_EMAIL}, expires_delta=timedelta(days=1)
+    )
     return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest_asyncio.fixture(scope="session")
+async def org_admin_role_id(test_engine) -> int:
+    """Look up the seeded org_admin role once; role rows never change in tests.
+
+    The role comes from migration b2ea20bcef20; under pytest-xdist
+    ``test_engine`` copies it into the worker schema (``seed_worker_rbac``).
+    """
+    async with test_engine.connect() as connection:
+        role_id = await connection.scalar(
+            select(Role.id).where(Role.name == "org_admin")
+        )
+    assert role_id is not None, (
+        "org_admin role is missing; run `alembic upgrade head` on the test database"
+    )
+    return role_id
+
+
 @pytest_asyncio.fixture
 async def test_regular_user(request, db_session: AsyncSession) -> User:
     """Create a regular (non-superuser) test user with unique email."""
@@ -307,7 +371,7 @@ async def test_regular_user(request, db_session: AsyncSession) -> User:
     
     user = User(
         email=email,
-        hashed_password=get_password_hash("test123"),
+        hashed_password=TEST_USER_PASSWORD_HASH,
         is_active=True,
         is_superuser=False,
         role="user",
@@ -505,6 +569,9 @@ async def site_with_outdated_modules(
         },
     ]
 
+    # Release dates are stored in naive UTC columns; compute "now" once
+    now = datetime.utcnow()
+
     site_modules = []
     for module_data in modules_data:
         # Create module
@@ -514,7 +581,7 @@ async def site_with_outdated_modules(
         old_version = ModuleVersion(
             module_id=module.id,
             version_string=module_data["old_version"],
-            release_date=datetime.utcnow() - timedelta(days=120),
+            release_date=now - timedelta(days=120),
             is_security_update=False,
             created_by=test_user.id,
             updated_by=test_user.id,
@@ -525,7 +592,7 @@ async def site_with_outdated_modules(
         new_version = ModuleVersion(
             module_id=module.id,
             version_string=module_data["new_version"],
-            release_date=datetime.utcnow() - timedelta(days=30),
+            release_date=now - timedelta(days=30),
             is_security_update=False,
             created_by=test_user.id,
             updated_by=test_user.id,
@@ -175,7 +175,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(site)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(site)
 
         # Combine core and contrib modules for standard site
@@ -205,6 +205,7 @@ class TestDataFactory:
             site_module = await self._create_site_module(site, module, version, user)
             created_objects["site_modules"].append(site_module)
 
+        await self.db_session.commit()
         return created_objects
 
     async def create_large_enterprise_site(
@@ -229,7 +230,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(site)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(site)
 
         # Generate additional contrib modules for enterprise site
@@ -281,6 +282,7 @@ class TestDataFactory:
             site_module = await self._create_site_module(site, module, version, user)
             created_objects["site_modules"].append(site_module)
 
+        await self.db_session.commit()
         return created_objects
 
     async def create_minimal_site(
@@ -303,7 +305,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(site)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(site)
 
         created_objects = {
@@ -327,6 +329,7 @@ class TestDataFactory:
             site_module = await self._create_site_module(site, module, version, user)
             created_objects["site_modules"].append(site_module)
 
+        await self.db_session.commit()
         return created_objects
 
     async def populate_security_scenarios(self, user: User) -> Dict[str, Any]:
@@ -395,6 +398,7 @@ class TestDataFactory:
 
             security_versions.extend([vulnerable_version, secure_version])
 
+        await self.db_session.commit()
         return {
             "security_modules": security_modules,
             "security_versions": security_versions,
@@ -446,7 +450,7 @@ class TestDataFactory:
                 updated_by=user.id,
             )
             self.db_session.add(site)
-            await self.db_session.commit()
+            await self.db_session.flush()
             await self.db_session.refresh(site)
 
             site_data = {
@@ -478,6 +482,7 @@ class TestDataFactory:
             all_modules.extend(site_data["modules"])
             all_site_modules.extend(site_data["site_modules"])
 
+        await self.db_session.commit()
         return {
             "sites": created_sites,
             "total_modules": len(set(m.id for m in all_modules)),  # Unique modules
@@ -515,7 +520,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(module)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(module)
 
         return module
@@ -546,7 +551,7 @@ class TestDataFactory:
             **kwargs,
         )
         self.db_session.add(version)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(version)
 
         return version
@@ -588,7 +593,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(version)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(version)
 
         return version
@@ -610,7 +615,7 @@ class TestDataFactory:
             updated_by=user.id,
         )
         self.db_session.add(site_module)
-        await self.db_session.commit()
+        await self.db_session.flush()
         await self.db_session.refresh(site_module)
 
         return site_module
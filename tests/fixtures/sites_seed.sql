@@ -0,0 +1,31 @@
+-- Seed data for site list/pagination/filter tests
+-- Loaded in a single round trip by the `seeded_sites` fixture, which binds the
+-- `test_organization` fixture's id as $1.
+--
+-- One statement: the second organization is created in a CTE so its id can be
+-- used by the sites inserted below.
+WITH other_org AS (
+    -- Second organization for organization filter tests
+    INSERT INTO organizations (uuid, name, description, is_active, is_deleted, created_at, updated_at)
+    VALUES (gen_random_uuid(), 'Other Organization', 'Another test organization', true, false, NOW(), NOW())
+    RETURNING id
+)
+INSERT INTO sites (name, url, description, organization_id, is_active, is_deleted, created_at, updated_at)
+-- Active sites in the test organization (enough to span two pages of 10)
+SELECT
+    'Test Site ' || i,
+    'https://test' || i || '.example.com',
+    'Test site ' || i,
+    $1::integer,
+    true, false, NOW(), NOW()
+FROM generate_series(0, 14) AS i
+-- Named sites for filter, search and sort tests
+UNION ALL
+SELECT 'Inactive Site', 'https://inactive.example.com', 'Inactive test site',
+       $1::integer, false, false, NOW(), NOW()
+UNION ALL
+SELECT 'Searchable Site', 'https://searchable.example.com', 'Site for search testing',
+       $1::integer, true, false, NOW(), NOW()
+UNION ALL
+SELECT 'Other Org Site', 'https://other-org.example.com', 'Site in another organization',
+       (SELECT id FROM other_org), true, false, NOW(), NOW();
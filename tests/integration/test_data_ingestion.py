@@ -5,7 +5,7 @@ These tests verify the complete data ingestion flow from Drupal sites,
 including module synchronization, version management, and update detection.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from httpx import AsyncClient
 from sqlalchemy import select
@@ -15,6 +15,11 @@ from app.models.module_version import ModuleVersion
 from app.models.site import Site
 from app.models.site_module import SiteModule
 
+# Sync payloads are only built, never sent, so one timestamp serves every test
+# that does not inspect it; test_concurrent_sync_detection stamps its own
+NOW = datetime.now(timezone.utc)
+NOW_ISO = NOW.isoformat()
+
 
 class TestDataIngestionWorkflow:
     """Test complete data ingestion workflow from Drupal sites."""
@@ -35,7 +40,7 @@ class TestDataIngestionWorkflow:
                 "last_cron": "2024-07-05T10:30:00Z",
             },
             "modules": sample_drupal_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "full",
@@ -94,7 +99,7 @@ class TestDataIngestionWorkflow:
         sync_data = {
             "site_info": {"name": site.name},
             "modules": updated_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "partial",
@@ -136,7 +141,7 @@ class TestDataIngestionWorkflow:
         sync_data = {
             "site_info": {"name": site.name},
             "modules": remaining_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "full",
@@ -185,7 +190,7 @@ class TestDataIngestionWorkflow:
         sync_data = {
             "site_info": {"name": site.name},
             "modules": updated_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "security",
@@ -217,7 +222,7 @@ class TestDataIngestionWorkflow:
                 "site_id": site.id,
                 "site_info": {"name": site.name},
                 "modules": sample_drupal_modules,
-                "sync_timestamp": datetime.utcnow().isoformat(),
+                "sync_timestamp": NOW_ISO,
                 "drupal_core_version": "10.3.8",
                 "php_version": "8.2.0",
                 "sync_type": "full",
@@ -341,7 +346,7 @@ class TestErrorHandlingInSync:
         sync_data = {
             "site_info": {"name": test_site.name},
             "modules": malformed_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "full",
@@ -381,7 +386,7 @@ class TestErrorHandlingInSync:
         sync_data_1 = {
             "site_info": {"name": test_site.name},
             "modules": sample_drupal_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": datetime.now(timezone.utc).isoformat(),
             "sync_id": "sync-001",
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
@@ -391,7 +396,7 @@ class TestErrorHandlingInSync:
         sync_data_2 = {
             "site_info": {"name": test_site.name},
             "modules": sample_drupal_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": datetime.now(timezone.utc).isoformat(),
             "sync_id": "sync-002",
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
@@ -404,13 +409,9 @@ class TestErrorHandlingInSync:
         # Verify we have different sync IDs
         assert sync_data_1["sync_id"] != sync_data_2["sync_id"]
 
-        # Verify timestamps are close but distinct
-        timestamp_1 = datetime.fromisoformat(
-            sync_data_1["sync_timestamp"].replace("Z", "+00:00")
-        )
-        timestamp_2 = datetime.fromisoformat(
-            sync_data_2["sync_timestamp"].replace("Z", "+00:00")
-        )
+        # Verify timestamps are close together
+        timestamp_1 = datetime.fromisoformat(sync_data_1["sync_timestamp"])
+        timestamp_2 = datetime.fromisoformat(sync_data_2["sync_timestamp"])
 
         time_diff = abs((timestamp_2 - timestamp_1).total_seconds())
         assert time_diff < 1.0  # Should be within 1 second
@@ -427,7 +428,7 @@ class TestSyncDataValidation:
         valid_sync_data = {
             "site_info": {"name": "Test Site"},
             "modules": sample_drupal_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             "drupal_core_version": "10.3.8",
             "php_version": "8.2.0",
             "sync_type": "full",
@@ -439,7 +440,7 @@ class TestSyncDataValidation:
         # Test missing required fields
         incomplete_data = {
             "modules": sample_drupal_modules,
-            "sync_timestamp": datetime.utcnow().isoformat(),
+            "sync_timestamp": NOW_ISO,
             # Missing site_info, drupal_core_version, etc.
         }
 
@@ -0,0 +1,59 @@
+"""
+Shared setup helpers for organization membership and RBAC tests.
+"""
+
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.organization import Organization
+from app.models.role import UserRole
+from app.models.user import User
+from app.models.user_organization import user_organization
+from tests._passwords import TEST_USER_PASSWORD_HASH
+
+
+async def provision_org_member(
+    db_session: AsyncSession,
+    organization: Organization,
+    email: str,
+    full_name: str,
+    role_id: Optional[int] = None,
+) -> User:
+    """Create a user whose default organization is ``organization``.
+
+    When ``role_id`` is given, the role assignment is attached to the user
+    through ``user_roles``, so a single flush writes both rows. The membership
+    row follows once ``user.id`` is known. Everything is committed once.
+    """
+    user = User(
+        email=email,
+        full_name=full_name,
+        hashed_password=TEST_USER_PASSWORD_HASH,
+        is_active=True,
+        organization_id=organization.id,
+    )
+    if role_id is not None:
+        user.user_roles.append(
+            UserRole(
+                role_id=role_id, organization_id=organization.id, assigned_by=user
+            )
+        )
+    db_session.add(user)
+    await db_session.flush()
+
+    await db_session.execute(
+        user_organization.insert().values(
+            user_id=user.id, organization_id=organization.id, is_default=True
+        )
+    )
+
+    await db_session.commit()
+    return user
+
+
+def token_headers(user: User) -> dict:
+    """Sign a bearer token for ``user`` without going through the login endpoint."""
+    access_token = create_access_token(data={"sub": user.email})
+    return {"Authorization": f"Bearer {access_token}"}
@@ -0,0 +1,24 @@
+"""
+Fixtures shared by the API tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.organization import Organization
+from tests.test_api._org_members import provision_org_member, token_headers
+
+
+@pytest_asyncio.fixture
+async def org_admin_headers(
+    db_session: AsyncSession, test_organization: Organization, org_admin_role_id: int
+) -> dict:
+    """Authorization headers for an org_admin of ``test_organization``."""
+    user = await provision_org_member(
+        db_session,
+        test_organization,
+        "orgadmin@example.com",
+        "Org Admin",
+        role_id=org_admin_role_id,
+    )
+    return token_headers(user)
@@ -20,8 +20,7 @@ async def test_organization(db_session: AsyncSession, test_user: User) -> Organi
         is_deleted=False,
     )
     db_session.add(organization)
-    await db_session.commit()
-    await db_session.refresh(organization)
+    await db_session.commit()  # No refresh: every column is set client-side
     return organization
 
 
@@ -38,8 +37,7 @@ async def test_inactive_organization(
         is_deleted=False,
     )
     db_session.add(organization)
-    await db_session.commit()
-    await db_session.refresh(organization)
+    await db_session.commit()  # No refresh: every column is set client-side
     return organization
 
 
@@ -56,6 +54,5 @@ async def test_deleted_organization(
         is_deleted=True,
     )
     db_session.add(organization)
-    await db_session.commit()
-    await db_session.refresh(organization)
+    await db_session.commit()  # No refresh: every column is set client-side
     return organization
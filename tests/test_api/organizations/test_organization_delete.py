@@ -90,13 +90,8 @@ async def test_delete_organization_cleanup(
     )
     assert response.status_code == 200
 
-    # Verify organization is deleted
-    response = await client.get(
-        f"/api/v1/organizations/{test_organization.id}", headers=superuser_token_headers
-    )
-    assert response.status_code == 404
-
-    # Verify user's organization association is removed
+    # test_delete_organization already checks that a deleted organization
+    # reads as 404, so only the user's association is verified here
     await db_session.refresh(test_user)
     assert test_user.organization_id is None
 
@@ -2,9 +2,10 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.security import create_access_token
 from app.models.organization import Organization
 from app.models.user import User
+from tests._passwords import TEST_USER_PASSWORD_HASH
 
 pytestmark = pytest.mark.asyncio
 
@@ -20,21 +21,21 @@ async def test_get_organizations_as_org_admin(
     org_id = test_organization.id
     superuser_id = test_superuser.id
 
-    # Create an organization admin user (without setting organization_id initially to avoid FK constraint)
+    # Create an organization admin user in test_organization and another
+    # organization that shouldn't be visible, in a single flush
     org_admin = User(
         email="orgadmin@example.com",
-        hashed_password=get_password_hash("testpass123"),
+        hashed_password=TEST_USER_PASSWORD_HASH,
         role="organization_admin",
         is_active=True,
+        organization_id=org_id,
     )
-    db_session.add(org_admin)
-    await db_session.commit()
-    await db_session.refresh(org_admin)
-    
-    # Now set the organization_id after user is created
-    org_admin.organization_id = org_id
-    db_session.add(org_admin)
-    await db_session.commit()
+    other_org = Organization(
+        name="Other Organization", created_by=superuser_id, updated_by=superuser_id
+    )
+    db_session.add_all([org_admin, other_org])
+    await db_session.flush()
+    other_org_id = other_org.id
 
     # Add user to organization junction table
     from app.models.user_organization import user_organization
@@ -45,22 +46,8 @@ async def test_get_organizations_as_org_admin(
     )
     await db_session.commit()
 
-    # Create another organization that shouldn't be visible
-    other_org = Organization(
-        name="Other Organization", created_by=superuser_id, updated_by=superuser_id
-    )
-    db_session.add(other_org)
-    await db_session.commit()
-    await db_session.refresh(other_org)
-    other_org_id = other_org.id
-
-    # Get token for org admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": org_admin.email, "password": "testpass123"},
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
+    # Sign a token for the org admin; login itself is covered by test_auth.py
+    token = create_access_token(data={"sub": org_admin.email})
 
     # Test organization listing
     response = await client.get(
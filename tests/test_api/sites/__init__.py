@@ -6,7 +6,7 @@ Please see the following files for specific test cases:
 2. test_site_read.py - Read/List-related tests
 3. test_site_update.py - Update-related tests
 4. test_site_delete.py - Delete-related tests
-5. test_site_monitoring.py - Monitoring and status tests
-6. test_site_permissions.py - Permission and authorization tests
-7. test_site_pagination.py - Pagination and filtering tests
+5. test_site_permissions.py - Permission and authorization tests
+6. test_site_pagination.py - Pagination and filtering tests
+7. test_sites_overview.py - Sites overview listing tests
 """
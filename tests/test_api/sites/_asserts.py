@@ -0,0 +1,16 @@
+"""
+Shared assertion helpers for site tests.
+"""
+
+from httpx import Response
+
+
+def assert_forbidden(response: Response) -> None:
+    """Assert that a request was rejected for lack of permissions."""
+    assert response.status_code == 403, response.text
+    assert "Not enough permissions" in response.json()["detail"]
+
+
+def normalized_url(url: str) -> str:
+    """Return ``url`` the way the API serializes it (Pydantic HttpUrl adds "/")."""
+    return url if url.endswith("/") else f"{url}/"
@@ -2,13 +2,54 @@
 Fixtures specific to site tests.
 """
 
+from pathlib import Path
+
 import pytest
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.organization import Organization
 from app.models.site import Site
 from app.models.user import User
 
+pytest.register_assert_rewrite("tests.test_api.sites._asserts")
+
+SITES_SEED_PATH = Path(__file__).parents[2] / "fixtures" / "sites_seed.sql"
+
+
+@pytest.fixture
+def anon_client(override_get_db, session_client: AsyncClient) -> AsyncClient:
+    """Return the shared test client for requests sent without credentials.
+
+    It goes through ``override_get_db`` like ``client``, so an unauthenticated
+    request that reaches ``get_db`` still uses this test's transaction and the
+    worker's schema. The shared client carries no default headers, so no
+    credentials need stripping.
+    """
+    return session_client
+
+
+@pytest.fixture(scope="session")
+def sites_seed_sql() -> str:
+    """Read the site seed script once per test session."""
+    return SITES_SEED_PATH.read_text()
+
+
+@pytest.fixture
+async def seeded_sites(
+    db_session: AsyncSession, test_organization: Organization, sites_seed_sql: str
+) -> None:
+    """Load the site seed script for list/filter tests.
+
+    The script is a single statement sent straight to asyncpg with the owning
+    organization's id bound as ``$1``, so the whole seed costs one round trip
+    instead of one ORM flush per row.
+    """
+    conn = await db_session.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.execute(sites_seed_sql, test_organization.id)
+    await db_session.commit()
+
 
 @pytest.fixture
 async def test_site(
@@ -31,6 +72,43 @@ async def test_site(
     return site
 
 
+@pytest.fixture
+async def admin_site(db_session: AsyncSession, test_organization: Organization) -> Site:
+    """Create a site for admin update/delete tests without going through the API."""
+    site = Site(
+        name="Admin Site",
+        url="https://admin.example.com",
+        description="Site created by admin",
+        organization_id=test_organization.id,
+        is_active=True,
+        is_deleted=False,
+    )
+    db_session.add(site)
+    await db_session.commit()
+    return site
+
+
+@pytest.fixture
+async def other_org_site(db_session: AsyncSession) -> Site:
+    """Create a site owned by a separate, persisted organization."""
+    other_org = Organization(
+        name="Other Organization",
+        is_active=True,
+        is_deleted=False,
+    )
+    site = Site(
+        name="Other Org Site",
+        url="https://other-org.example.com",
+        description="Site in another organization",
+        organization=other_org,
+        is_active=True,
+        is_deleted=False,
+    )
+    db_session.add(site)
+    await db_session.commit()
+    return site
+
+
 @pytest.fixture
 async def test_inactive_site(
     db_session: AsyncSession, test_organization: Organization, test_user: User
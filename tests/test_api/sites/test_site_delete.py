@@ -4,10 +4,12 @@ Tests for site delete operations.
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.organization import Organization
 from app.models.site import Site
+from tests.test_api.sites._asserts import assert_forbidden
 
 pytestmark = pytest.mark.asyncio
 
@@ -45,8 +47,7 @@ async def test_delete_site_unauthorized(
     response = await client.delete(
         f"/api/v1/sites/{test_site.id}", headers=user_token_headers
     )
-    assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
+    assert_forbidden(response)
 
 
 async def test_delete_monitored_site(
@@ -88,21 +89,23 @@ async def test_delete_multiple_sites(
     test_organization: Organization,
 ):
     """Test deleting multiple sites."""
-    # Create multiple sites
-    site_ids = []
-    for i in range(3):
-        site = Site(
-            name=f"Site to Delete {i}",
-            url=f"https://todelete{i}.example.com",
-            description=f"Site {i} to be deleted",
-            organization_id=test_organization.id,
-            is_active=True,
-            is_deleted=False,
-        )
-        db_session.add(site)
-        await db_session.commit()
-        await db_session.refresh(site)
-        site_ids.append(site.id)
+    # Create multiple sites with a single executemany INSERT ... RETURNING
+    result = await db_session.execute(
+        insert(Site).returning(Site.id),
+        [
+            {
+                "name": f"Site to Delete {i}",
+                "url": f"https://todelete{i}.example.com",
+                "description": f"Site {i} to be deleted",
+                "organization_id": test_organization.id,
+                "is_active": True,
+                "is_deleted": False,
+            }
+            for i in range(3)
+        ],
+    )
+    site_ids = result.scalars().all()
+    await db_session.commit()
 
     # Delete each site
     for site_id in site_ids:
@@ -4,86 +4,101 @@ Tests for site permissions and authorization.
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.organization import Organization
 from app.models.site import Site
+from app.models.user import User
+from tests.test_api.sites._asserts import assert_forbidden
 
 pytestmark = pytest.mark.asyncio
 
 
-async def test_regular_user_cant_create_site(
-    client: AsyncClient, user_token_headers: dict, test_organization: Organization
+@pytest.mark.parametrize(
+    "method, path, body",
+    [
+        (
+            "POST",
+            "/api/v1/sites/",
+            {
+                "name": "Unauthorized Site",
+                "url": "https://unauthorized.example.com",
+                "description": "Site created by unauthorized user",
+            },
+        ),
+        ("PUT", "/api/v1/sites/{site_id}", {"name": "Updated Site Name"}),
+        ("DELETE", "/api/v1/sites/{site_id}", None),
+    ],
+    ids=["create", "update", "delete"],
+)
+async def test_regular_user_cant_modify_site(
+    client: AsyncClient,
+    user_token_headers: dict,
+    test_organization: Organization,
+    test_site: Site,
+    method: str,
+    path: str,
+    body: dict | None,
 ):
-    """Test that regular users cannot create sites."""
-    response = await client.post(
-        "/api/v1/sites/",
+    """Test that regular users cannot create, update or delete sites."""
+    if method == "POST":
+        body = {**body, "organization_id": test_organization.id}
+    response = await client.request(
+        method,
+        path.format(site_id=test_site.id),
         headers=user_token_headers,
-        json={
-            "name": "Unauthorized Site",
-            "url": "https://unauthorized.example.com",
-            "description": "Site created by unauthorized user",
-            "organization_id": test_organization.id,
-        },
+        json=body,
     )
-    assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
+    assert_forbidden(response)
 
 
-async def test_regular_user_cant_update_site(
-    client: AsyncClient, user_token_headers: dict, test_site: Site
+async def test_user_cant_delete_other_organization_site(
+    client: AsyncClient,
+    user_token_headers: dict,
+    test_user: User,
+    test_organization: Organization,
+    other_org_site: Site,
+    db_session: AsyncSession,
 ):
-    """Test that regular users cannot update sites."""
-    response = await client.put(
-        f"/api/v1/sites/{test_site.id}",
-        headers=user_token_headers,
-        json={"name": "Updated Site Name"},
+    """Test that users cannot delete sites belonging to another organization."""
+    await db_session.execute(
+        update(User)
+        .where(User.id == test_user.id)
+        .values(organization_id=test_organization.id)
     )
-    assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
-
+    await db_session.commit()
 
-async def test_regular_user_cant_delete_site(
-    client: AsyncClient, user_token_headers: dict, test_site: Site
-):
-    """Test that regular users cannot delete sites."""
     response = await client.delete(
-        f"/api/v1/sites/{test_site.id}", headers=user_token_headers
+        f"/api/v1/sites/{other_org_site.id}", headers=user_token_headers
     )
-    assert response.status_code == 403
-    assert "Not enough permissions" in response.json()["detail"]
+    assert_forbidden(response)
 
 
+@pytest.mark.parametrize(
+    "method, body, expected_status",
+    [
+        ("PUT", {"name": "Updated Admin Site"}, 200),
+        ("DELETE", None, 204),
+    ],
+    ids=["update", "delete"],
+)
 async def test_admin_can_manage_organization_sites(
-    client: AsyncClient, superuser_token_headers: dict, test_organization: Organization
+    client: AsyncClient,
+    superuser_token_headers: dict,
+    admin_site: Site,
+    method: str,
+    body: dict | None,
+    expected_status: int,
 ):
     """Test that organization admins can manage sites in their organization."""
-    # Create new site
-    response = await client.post(
-        "/api/v1/sites/",
+    response = await client.request(
+        method,
+        f"/api/v1/sites/{admin_site.id}",
         headers=superuser_token_headers,
-        json={
-            "name": "Admin Site",
-            "url": "https://admin.example.com",
-            "description": "Site created by admin",
-            "organization_id": test_organization.id,
-        },
-    )
-    assert response.status_code == 201
-    site_id = response.json()["id"]
-
-    # Update site
-    response = await client.put(
-        f"/api/v1/sites/{site_id}",
-        headers=superuser_token_headers,
-        json={"name": "Updated Admin Site"},
-    )
-    assert response.status_code == 200
-
-    # Delete site
-    response = await client.delete(
-        f"/api/v1/sites/{site_id}", headers=superuser_token_headers
+        json=body,
     )
-    assert response.status_code == 204
+    assert response.status_code == expected_status
 
 
 async def test_superuser_can_update_any_site(
@@ -103,11 +118,10 @@ async def test_superuser_can_update_any_site(
     assert response.json()["name"] == "Updated Site Name by Superuser"
 
 
-async def test_superuser_can_manage_all_sites(
+async def test_superuser_can_create_site(
     client: AsyncClient, superuser_token_headers: dict, test_organization: Organization
 ):
-    """Test that superusers can manage all sites regardless of organization."""
-    # Create site in the test organization
+    """Test that superusers can create sites in any organization."""
     response = await client.post(
         "/api/v1/sites/",
         headers=superuser_token_headers,
@@ -119,21 +133,7 @@ async def test_superuser_can_manage_all_sites(
         },
     )
     assert response.status_code == 201
-    site_id = response.json()["id"]
-
-    # Update site
-    response = await client.put(
-        f"/api/v1/sites/{site_id}",
-        headers=superuser_token_headers,
-        json={"name": "Updated Superuser Site"},
-    )
-    assert response.status_code == 200
-
-    # Delete site
-    response = await client.delete(
-        f"/api/v1/sites/{site_id}", headers=superuser_token_headers
-    )
-    assert response.status_code == 204
+    assert response.json()["organization_id"] == test_organization.id
 
 
 async def test_user_can_view_organization_sites(
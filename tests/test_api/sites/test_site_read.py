@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.organization import Organization
 from app.models.site import Site
+from tests.test_api.sites._asserts import normalized_url
 
 pytestmark = pytest.mark.asyncio
 
@@ -20,17 +21,9 @@ async def test_get_sites(
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
-    
-    # Debug output
-    print(f"DEBUG: test_site.url = {test_site.url}")
-    print(f"DEBUG: response data length = {len(data)}")
-    if data:
-        print(f"DEBUG: first site = {data[0]}")
-        for site in data:
-            print(f"DEBUG: site url = {site.get('url')}")
-    
     assert len(data) > 0
-    assert any(site["url"] == test_site.url + "/" for site in data)
+    expected_url = normalized_url(test_site.url)
+    assert any(site["url"] == expected_url for site in data)
 
 
 async def test_get_site(
@@ -43,7 +36,7 @@ async def test_get_site(
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == test_site.name
-    assert data["url"] == test_site.url + "/"  # Pydantic HttpUrl adds trailing slash
+    assert data["url"] == normalized_url(test_site.url)
     assert data["organization_id"] == test_site.organization_id
 
 
@@ -63,17 +56,20 @@ async def test_get_organization_sites(
 ):
     """Test getting all sites in an organization."""
     # Create additional sites in the organization
-    for i in range(2):
-        site = Site(
-            name=f"Org Site {i}",
-            url=f"https://orgsite{i}.example.com",
-            description=f"Organization site {i}",
-            organization_id=test_organization.id,
-            is_active=True,
-            is_deleted=False,
-        )
-        db_session.add(site)
-    await db_session.commit()
+    db_session.add_all(
+        [
+            Site(
+                name=f"Org Site {i}",
+                url=f"https://orgsite{i}.example.com",
+                description=f"Organization site {i}",
+                organization_id=test_organization.id,
+                is_active=True,
+                is_deleted=False,
+            )
+            for i in range(2)
+        ]
+    )
+    await db_session.flush()
 
     response = await client.get(
         f"/api/v1/organizations/{test_organization.id}/sites",
@@ -121,7 +117,7 @@ async def test_get_site_with_monitoring_data(
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == test_monitored_site.name
-    assert data["url"] == test_monitored_site.url + "/"  # Pydantic HttpUrl adds trailing slash
+    assert data["url"] == normalized_url(test_monitored_site.url)
     assert "last_check_time" in data
     assert "status" in data
     assert "response_time" in data
@@ -1,93 +1,140 @@
 """Tests for sites overview endpoint."""
 
+from itertools import pairwise
+from typing import AsyncGenerator
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from app.models.organization import Organization
 from app.models.site import Site
 from app.models.user import User
-
-
+from tests._passwords import TEST_USER_PASSWORD_HASH
+
+
+# name, url, security_score, total_modules_count, security_updates_count,
+# non_security_updates_count
+OVERVIEW_SITES = [
+    # Healthy (high security score)
+    ("Healthy Site", "https://healthy.example.com", 95, 20, 0, 1),
+    # Warning (medium security score)
+    ("Warning Site", "https://warning.example.com", 65, 35, 0, 8),
+    # Critical (low security score, security updates needed)
+    ("Critical Site", "https://critical.example.com", 25, 50, 5, 10),
+]
+
+REQUIRED_SITE_FIELDS = frozenset(
+    [
+        "id",
+        "name",
+        "url",
+        "security_score",
+        "total_modules_count",
+        "security_updates_count",
+        "non_security_updates_count",
+        "last_data_push",
+        "last_drupal_org_check",
+        "status",
+        "organization_id",
+    ]
+)
+
+
+@pytest.mark.xdist_group("sites_overview")
 class TestSitesOverview:
     """Test cases for GET /api/v1/sites/overview endpoint."""
 
-    @pytest.fixture
-    async def setup_test_data(self, db_session: AsyncSession, test_user: User):
-        """Create test data for sites overview tests."""
+    @pytest.fixture(scope="class")
+    async def db_connection(self, test_engine) -> AsyncGenerator[AsyncConnection, None]:
+        """Hold one transaction open for the class so setup data is built once."""
+        async with test_engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                yield connection
+            finally:
+                await transaction.rollback()
+
+    @pytest.fixture(scope="class")
+    async def class_session(
+        self, db_connection: AsyncConnection
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Create a session for the class-scoped fixtures."""
+        async with AsyncSession(
+            bind=db_connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+
+    @pytest.fixture(autouse=True)
+    async def rollback_test_changes(self, db_connection: AsyncConnection):
+        """Undo each test's own writes so the shared class data stays intact."""
+        savepoint = await db_connection.begin_nested()
+        try:
+            yield
+        finally:
+            await savepoint.rollback()
+
+    @pytest.fixture(scope="class")
+    async def test_user(self, class_session: AsyncSession) -> User:
+        """Create the user shared by every test in the class."""
+        user = User(
+            email="sites_overview_user@example.com",
+            hashed_password=TEST_USER_PASSWORD_HASH,
+            is_active=True,
+            role="user",
+        )
+        class_session.add(user)
+        await class_session.commit()
+        return user
 
+    @pytest.fixture(scope="class")
+    async def setup_test_data(self, class_session: AsyncSession, test_user: User):
+        """Create test data for sites overview tests."""
         # Create organization
         org = Organization(
             name="Test Org",
             description="Test organization for sites overview",
             created_by=test_user.id,
         )
-        db_session.add(org)
-        await db_session.commit()
-        await db_session.refresh(org)
+        class_session.add(org)
+        await class_session.flush()
 
         # Update test user to belong to this organization
         test_user.organization_id = org.id
-        await db_session.commit()
-        await db_session.refresh(test_user)
-
-        # Create sites with different security profiles
-        sites = []
-
-        # Site 1: Healthy (high security score)
-        site1 = Site(
-            name="Healthy Site",
-            url="https://healthy.example.com",
-            organization_id=org.id,
-            security_score=95,
-            total_modules_count=20,
-            security_updates_count=0,
-            non_security_updates_count=1,
-            created_by=test_user.id,
-            updated_by=test_user.id,
-            is_active=True,
-            is_deleted=False,
-        )
-        db_session.add(site1)
-        sites.append(site1)
-
-        # Site 2: Warning (medium security score)
-        site2 = Site(
-            name="Warning Site",
-            url="https://warning.example.com",
-            organization_id=org.id,
-            security_score=65,
-            total_modules_count=35,
-            security_updates_count=0,
-            non_security_updates_count=8,
-            created_by=test_user.id,
-            updated_by=test_user.id,
-            is_active=True,
-            is_deleted=False,
-        )
-        db_session.add(site2)
-        sites.append(site2)
-
-        # Site 3: Critical (low security score, security updates needed)
-        site3 = Site(
-            name="Critical Site",
-            url="https://critical.example.com",
-            organization_id=org.id,
-            security_score=25,
-            total_modules_count=50,
-            security_updates_count=5,
-            non_security_updates_count=10,
-            created_by=test_user.id,
-            updated_by=test_user.id,
-            is_active=True,
-            is_deleted=False,
-        )
-        db_session.add(site3)
-        sites.append(site3)
 
-        await db_session.commit()
-        for site in sites:
-            await db_session.refresh(site)
+        # Create sites with different security profiles in one INSERT
+        sites = (
+            await class_session.scalars(
+                insert(Site).returning(Site),
+                [
+                    {
+                        "name": name,
+                        "url": url,
+                        "organization_id": org.id,
+                        "security_score": security_score,
+                        "total_modules_count": total_modules,
+                        "security_updates_count": security_updates,
+                        "non_security_updates_count": non_security_updates,
+                        "created_by": test_user.id,
+                        "updated_by": test_user.id,
+                        "is_active": True,
+                        "is_deleted": False,
+                    }
+                    for (
+                        name,
+                        url,
+                        security_score,
+                        total_modules,
+                        security_updates,
+                        non_security_updates,
+                    ) in OVERVIEW_SITES
+                ],
+            )
+        ).all()
+        await class_session.commit()
 
         return {"organization": org, "sites": sites}
 
@@ -123,22 +170,7 @@ class TestSitesOverview:
         assert len(sites) == 3
 
         # Verify site data structure
-        site = sites[0]
-        required_fields = [
-            "id",
-            "name",
-            "url",
-            "security_score",
-            "total_modules_count",
-            "security_updates_count",
-            "non_security_updates_count",
-            "last_data_push",
-            "last_drupal_org_check",
-            "status",
-            "organization_id",
-        ]
-        for field in required_fields:
-            assert field in site
+        assert REQUIRED_SITE_FIELDS <= sites[0].keys()
 
         # Check status calculation
         site_statuses = {s["name"]: s["status"] for s in sites}
@@ -228,11 +260,8 @@ class TestSitesOverview:
             headers=user_token_headers,
         )
         assert response.status_code == 200
-        data = response.json()
-
-        sites = data["sites"]
-        scores = [site["security_score"] for site in sites]
-        assert scores == sorted(scores)  # Should be in ascending order
+        scores = [site["security_score"] for site in response.json()["sites"]]
+        assert all(a <= b for a, b in pairwise(scores))  # Ascending order
 
         # Sort by security score descending
         response = await client.get(
@@ -240,11 +269,8 @@ class TestSitesOverview:
             headers=user_token_headers,
         )
         assert response.status_code == 200
-        data = response.json()
-
-        sites = data["sites"]
-        scores = [site["security_score"] for site in sites]
-        assert scores == sorted(scores, reverse=True)  # Should be in descending order
+        scores = [site["security_score"] for site in response.json()["sites"]]
+        assert all(a >= b for a, b in pairwise(scores))  # Descending order
 
         # Sort by name
         response = await client.get(
@@ -252,11 +278,8 @@ class TestSitesOverview:
             headers=user_token_headers,
         )
         assert response.status_code == 200
-        data = response.json()
-
-        sites = data["sites"]
-        names = [site["name"] for site in sites]
-        assert names == sorted(names)
+        names = [site["name"] for site in response.json()["sites"]]
+        assert all(a <= b for a, b in pairwise(names))
 
     async def test_sites_overview_filters_response(
         self,
@@ -295,8 +318,7 @@ class TestSitesOverview:
             created_by=test_user.id,
         )
         db_session.add(other_org)
-        await db_session.commit()
-        await db_session.refresh(other_org)
+        await db_session.flush()  # Assigns other_org.id
 
         other_site = Site(
             name="Other Org Site",
@@ -353,10 +375,7 @@ class TestSitesOverview:
         )
         assert response.status_code == 422  # Validation error
 
-    async def test_sites_overview_unauthorized(self, client: AsyncClient):
+    async def test_sites_overview_unauthorized(self, anon_client: AsyncClient):
         """Test that unauthenticated requests are rejected."""
-        # Remove authorization header
-        client.headers.pop("Authorization", None)
-
-        response = await client.get("/api/v1/sites/overview")
+        response = await anon_client.get("/api/v1/sites/overview")
         assert response.status_code == 401
@@ -2,12 +2,12 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
 from app.models.user import User
+from tests._passwords import TEST_USER_PASSWORD, TEST_USER_PASSWORD_HASH
 
 pytestmark = pytest.mark.asyncio
 
-TEST_PASSWORD = "test123"  # Match the password from conftest.py
+INVALID_TOKEN_HEADERS = {"Authorization": "Bearer invalid_token"}
 
 
 async def test_login_access_token(client: AsyncClient, test_user: User):
@@ -16,7 +16,7 @@ async def test_login_access_token(client: AsyncClient, test_user: User):
         "/api/v1/auth/access-token",
         data={
             "username": test_user.email,
-            "password": TEST_PASSWORD,  # Use the correct password
+            "password": TEST_USER_PASSWORD,  # Use the correct password
         },
     )
     assert response.status_code == 200
@@ -35,22 +35,12 @@ async def test_login_invalid_password(client: AsyncClient, test_user: User):
     assert response.json()["detail"] == "Invalid email or password. Please check your credentials and try again."
 
 
-async def test_login_invalid_email(client: AsyncClient):
-    """Test login with non-existent email."""
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "nonexistent@example.com", "password": TEST_PASSWORD},
-    )
-    assert response.status_code == 401
-    assert response.json()["detail"] == "Invalid email or password. Please check your credentials and try again."
-
-
 async def test_login_inactive_user(client: AsyncClient, db_session: AsyncSession):
     """Test login with inactive user."""
     # Create an inactive user
     inactive_user = User(
         email="inactive@example.com",
-        hashed_password=get_password_hash(TEST_PASSWORD),
+        hashed_password=TEST_USER_PASSWORD_HASH,
         is_active=False,
     )
     db_session.add(inactive_user)
@@ -58,51 +48,30 @@ async def test_login_inactive_user(client: AsyncClient, db_session: AsyncSession
 
     response = await client.post(
         "/api/v1/auth/access-token",
-        data={"username": "inactive@example.com", "password": TEST_PASSWORD},
+        data={"username": "inactive@example.com", "password": TEST_USER_PASSWORD},
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Inactive user"
 
 
 async def test_test_token(
-    client: AsyncClient,
-    user_token_headers: dict,
-    test_user: User,
-    db_session: AsyncSession,
+    client: AsyncClient, user_token_headers: dict, test_user: User
 ):
     """Test token validation endpoint."""
-    # Store email before async operations
-    user_email = test_user.email
-
     response = await client.post("/api/v1/auth/test-token", headers=user_token_headers)
     assert response.status_code == 200
     data = response.json()
-    assert data["email"] == user_email
-
-
-async def test_test_token_invalid(client: AsyncClient):
-    """Test token validation with invalid token."""
-    response = await client.post(
-        "/api/v1/auth/test-token", headers={"Authorization": "Bearer invalid_token"}
-    )
-    assert response.status_code == 401
-    assert response.json()["detail"] == "Could not validate credentials"
+    assert data["email"] == test_user.email
 
 
 async def test_change_password(
-    client: AsyncClient,
-    user_token_headers: dict,
-    test_user: User,
-    db_session: AsyncSession,
+    client: AsyncClient, user_token_headers: dict, test_user: User
 ):
     """Test password change with valid current password."""
-    # Store email before async operations
-    user_email = test_user.email
-
     response = await client.post(
         "/api/v1/auth/change-password",
         headers=user_token_headers,
-        json={"current_password": TEST_PASSWORD, "new_password": "newtestpass123"},
+        json={"current_password": TEST_USER_PASSWORD, "new_password": "newtestpass123"},
     )
     assert response.status_code == 200
     assert response.json()["message"] == "Password changed successfully"
@@ -110,7 +79,7 @@ async def test_change_password(
     # Verify can login with new password
     response = await client.post(
         "/api/v1/auth/access-token",
-        data={"username": user_email, "password": "newtestpass123"},
+        data={"username": test_user.email, "password": "newtestpass123"},
     )
     assert response.status_code == 200
     assert "access_token" in response.json()
@@ -130,33 +99,16 @@ async def test_change_password_invalid_current(
 
 
 async def test_get_current_user(
-    client: AsyncClient,
-    user_token_headers: dict,
-    test_user: User,
-    db_session: AsyncSession,
+    client: AsyncClient, user_token_headers: dict, test_user: User
 ):
     """Test getting current user details."""
-    # Store email before async operations
-    user_email = test_user.email
-
     response = await client.get("/api/v1/auth/me", headers=user_token_headers)
     assert response.status_code == 200
     data = response.json()
-    assert data["email"] == user_email
+    assert data["email"] == test_user.email
 
 
-async def test_get_current_user_invalid_token(client: AsyncClient):
-    """Test getting current user with invalid token."""
-    response = await client.get(
-        "/api/v1/auth/me", headers={"Authorization": "Bearer invalid_token"}
-    )
-    assert response.status_code == 401
-    assert response.json()["detail"] == "Could not validate credentials"
-
-
-async def test_logout_success(
-    client: AsyncClient, user_token_headers: dict, test_user: User
-):
+async def test_logout_success(client: AsyncClient, user_token_headers: dict):
     """Test successful logout with valid token."""
     response = await client.post("/api/v1/auth/logout", headers=user_token_headers)
     assert response.status_code == 200
@@ -164,17 +116,56 @@ async def test_logout_success(
     assert data["message"] == "Successfully logged out"
 
 
-async def test_logout_invalid_token(client: AsyncClient):
-    """Test logout with invalid token."""
-    response = await client.post(
-        "/api/v1/auth/logout", headers={"Authorization": "Bearer invalid_token"}
-    )
-    assert response.status_code == 401
-    assert response.json()["detail"] == "Could not validate credentials"
-
-
-async def test_logout_no_token(client: AsyncClient):
-    """Test logout without authentication token."""
-    response = await client.post("/api/v1/auth/logout")
+@pytest.mark.parametrize(
+    "method, path, headers, data, expected_detail",
+    [
+        (
+            "POST",
+            "/api/v1/auth/access-token",
+            None,
+            {"username": "nonexistent@example.com", "password": TEST_USER_PASSWORD},
+            "Invalid email or password. Please check your credentials and try again.",
+        ),
+        (
+            "POST",
+            "/api/v1/auth/test-token",
+            INVALID_TOKEN_HEADERS,
+            None,
+            "Could not validate credentials",
+        ),
+        (
+            "GET",
+            "/api/v1/auth/me",
+            INVALID_TOKEN_HEADERS,
+            None,
+            "Could not validate credentials",
+        ),
+        (
+            "POST",
+            "/api/v1/auth/logout",
+            INVALID_TOKEN_HEADERS,
+            None,
+            "Could not validate credentials",
+        ),
+        ("POST", "/api/v1/auth/logout", None, None, "Authentication required"),
+    ],
+    ids=[
+        "login_invalid_email",
+        "test_token_invalid",
+        "me_invalid_token",
+        "logout_invalid_token",
+        "logout_no_token",
+    ],
+)
+async def test_auth_rejects_bad_credentials(
+    client: AsyncClient,
+    method: str,
+    path: str,
+    headers: dict,
+    data: dict,
+    expected_detail: str,
+):
+    """Test that auth endpoints reject unknown users and missing or bad tokens."""
+    response = await client.request(method, path, headers=headers, data=data)
     assert response.status_code == 401
-    assert response.json()["detail"] == "Authentication required"
+    assert response.json()["detail"] == expected_detail
@@ -10,6 +10,7 @@ from app.models.user_organization import user_organization
 
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group("auth_register")
 async def test_register_user_with_default_organization(
     client: AsyncClient,
     db_session: AsyncSession
@@ -29,18 +30,15 @@ async def test_register_user_with_default_organization(
     data = response.json()
     assert data["email"] == "newuser@example.com"
     
-    # Check that organization was created
-    org_query = select(Organization).where(Organization.name == "New Org")
-    result = await db_session.execute(org_query)
-    org = result.scalar_one_or_none()
-    assert org is not None
-    
-    # Check that user-organization association has is_default=True
-    user_org_query = select(user_organization).where(
-        user_organization.c.user_id == data["id"],
-        user_organization.c.organization_id == org.id
+    # Check that the organization was created and the user-organization
+    # association has is_default=True
+    user_org_query = (
+        select(user_organization.c.is_default)
+        .join(Organization, Organization.id == user_organization.c.organization_id)
+        .where(
+            Organization.name == "New Org",
+            user_organization.c.user_id == data["id"],
+        )
     )
-    result = await db_session.execute(user_org_query)
-    user_org = result.fetchone()
-    assert user_org is not None
-    assert user_org.is_default is True
\ No newline at end of file
+    is_default = await db_session.scalar(user_org_query)
+    assert is_default is True  # None if the association is missing
@@ -1,226 +1,197 @@
 """Tests for full sync functionality including removed module detection."""
 
+from typing import AsyncGenerator
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from app import crud
 from app.models.organization import Organization
 from app.models.site import Site
 from app.models.user import User
 from app.schemas import ModuleCreate, ModuleVersionCreate, SiteModuleCreate
-
-
-class TestFullSync:
-    """Test full sync functionality."""
-
-    @pytest.mark.asyncio
-    async def test_full_sync_removes_missing_modules(
-        self,
-        client: AsyncClient,
-        db_session: AsyncSession,
-        superuser_token_headers: dict,
-        test_site: Site,
-        test_user: User,
-    ):
-        """Test that full sync removes modules not in the payload."""
-        # First, create some existing modules
-        module1 = await crud.crud_module.create_module(
-            db_session,
+from tests._passwords import TEST_USER_PASSWORD_HASH
+
+# Payload parts shared by every sync case; only "site" and "full_sync" vary
+SYNC_DRUPAL_INFO = {
+    "core_version": "10.3.8",
+    "php_version": "8.3.2",
+    "ip_address": "192.168.1.100",
+}
+SYNC_MODULES = [
+    {
+        "machine_name": "sync_module_1",
+        "display_name": "Sync Module 1",
+        "module_type": "contrib",
+        "enabled": True,
+        "version": "1.0.0",
+    }
+]
+
+
+async def create_installed_modules(
+    db: AsyncSession, site_id: int, user_id: int, machine_names: list[str]
+) -> dict[str, int]:
+    """Install version 1.0.0 of each contrib module on a site.
+
+    Each table is filled with one bulk INSERT and the batch is committed once.
+    Every module has a single version, so the availability flags keep their
+    defaults (no update available) without update_site_module_availability.
+
+    Returns the module ids keyed by machine name.
+    """
+    module_ids = await crud.crud_module.bulk_create_modules(
+        db,
+        [
             ModuleCreate(
-                machine_name="existing_module_1",
-                display_name="Existing Module 1",
+                machine_name=name,
+                display_name=name.replace("_", " ").title(),
                 module_type="contrib",
-            ),
-            test_user.id,
-        )
-
-        module2 = await crud.crud_module.create_module(
-            db_session,
-            ModuleCreate(
-                machine_name="existing_module_2",
-                display_name="Existing Module 2",
-                module_type="contrib",
-            ),
-            test_user.id,
-        )
-
-        # Create versions for the modules
-        version1 = await crud.crud_module_version.create_module_version(
-            db_session,
-            ModuleVersionCreate(module_id=module1.id, version_string="1.0.0"),
-            test_user.id,
-        )
-
-        version2 = await crud.crud_module_version.create_module_version(
-            db_session,
-            ModuleVersionCreate(module_id=module2.id, version_string="1.0.0"),
-            test_user.id,
-        )
-
-        # Associate modules with the site
-        await crud.crud_site_module.create_site_module(
-            db_session,
+            )
+            for name in machine_names
+        ],
+        user_id,
+    )
+    version_ids = await crud.crud_module_version.bulk_create_module_versions(
+        db,
+        [
+            ModuleVersionCreate(module_id=module_id, version_string="1.0.0")
+            for module_id in module_ids
+        ],
+        user_id,
+    )
+    await crud.crud_site_module.bulk_create_site_modules(
+        db,
+        [
             SiteModuleCreate(
-                site_id=test_site.id,
-                module_id=module1.id,
-                current_version_id=version1.id,
+                site_id=site_id,
+                module_id=module_id,
+                current_version_id=version_id,
                 enabled=True,
-            ),
-            test_user.id,
-        )
-
-        await crud.crud_site_module.create_site_module(
-            db_session,
-            SiteModuleCreate(
-                site_id=test_site.id,
-                module_id=module2.id,
-                current_version_id=version2.id,
-                enabled=True,
-            ),
-            test_user.id,
-        )
-
-        # Verify modules are associated
-        modules_before, _ = await crud.crud_site_module.get_site_modules(
-            db_session, site_id=test_site.id
-        )
-        assert len(modules_before) == 2
-
-        # Now perform a full sync with only one module
-        payload = {
-            "site": {
-                "url": test_site.url,
-                "name": test_site.name,
-                "token": "test-token",
-            },
-            "drupal_info": {
-                "core_version": "10.3.8",
-                "php_version": "8.3.2",
-                "ip_address": "192.168.1.100",
-            },
-            "modules": [
-                {
-                    "machine_name": "existing_module_1",  # Only include module 1
-                    "display_name": "Existing Module 1",
-                    "module_type": "contrib",
-                    "enabled": True,
-                    "version": "1.0.0",
-                }
-            ],
-            "full_sync": True,  # Enable full sync
-        }
-
-        response = await client.post(
-            f"/api/v1/sites/{test_site.id}/modules/sync",
-            json=payload,
-            headers=superuser_token_headers,
-        )
-
-        assert response.status_code == 200
-
-        # Check that module 2 was removed
-        modules_after, _ = await crud.crud_site_module.get_site_modules(
-            db_session, site_id=test_site.id
-        )
-        assert len(modules_after) == 1
-        assert modules_after[0].module.machine_name == "existing_module_1"
-
-        # Verify module 2 is soft deleted
-        site_module = await crud.crud_site_module.get_site_module_by_site_and_module(
-            db_session, test_site.id, module2.id
-        )
-        assert site_module is None  # Should be None because it's soft deleted
+            )
+            for module_id, version_id in zip(module_ids, version_ids)
+        ],
+        user_id,
+    )
+    await db.commit()
+    return dict(zip(machine_names, module_ids))
+
+
+@pytest.fixture(scope="module")
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Hold one transaction open for the module so setup data is built once."""
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="module")
+async def module_session(
+    db_connection: AsyncConnection,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a session for the module-scoped fixtures."""
+    async with AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+async def rollback_test_changes(db_connection: AsyncConnection):
+    """Undo each test's sync so every test starts from the same modules."""
+    savepoint = await db_connection.begin_nested()
+    try:
+        yield
+    finally:
+        await savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+async def test_user(module_session: AsyncSession) -> User:
+    """Create the user shared by every test in the module."""
+    user = User(
+        email="full_sync_user@example.com",
+        hashed_password=TEST_USER_PASSWORD_HASH,
+        is_active=True,
+        role="user",
+    )
+    module_session.add(user)
+    await module_session.commit()
+    return user
+
+
+@pytest.fixture(scope="module")
+async def test_site(module_session: AsyncSession, test_user: User) -> Site:
+    """Create the site whose modules are synced."""
+    site = Site(
+        name="Sync Site",
+        url="https://sync.example.com",
+        organization=Organization(
+            name="Sync Organization",
+            created_by=test_user.id,
+            updated_by=test_user.id,
+        ),
+        created_by=test_user.id,
+        updated_by=test_user.id,
+        is_active=True,
+        is_deleted=False,
+    )
+    module_session.add(site)
+    await module_session.commit()
+    return site
+
+
+@pytest.fixture(scope="module")
+async def installed_modules(
+    module_session: AsyncSession, test_site: Site, test_user: User
+) -> dict[str, int]:
+    """Install two modules on the site once for the whole module."""
+    return await create_installed_modules(
+        module_session, test_site.id, test_user.id, ["sync_module_1", "sync_module_2"]
+    )
+
+
+@pytest.mark.xdist_group("full_sync")
+class TestFullSync:
+    """Test full sync functionality."""
 
     @pytest.mark.asyncio
-    async def test_partial_sync_keeps_all_modules(
+    @pytest.mark.usefixtures("installed_modules")
+    @pytest.mark.parametrize(
+        "full_sync, expected_active, expected_removed",
+        [
+            (True, {"sync_module_1"}, {"sync_module_2"}),
+            (False, {"sync_module_1", "sync_module_2"}, set()),
+        ],
+        ids=["full_sync_removes_missing_modules", "partial_sync_keeps_all_modules"],
+    )
+    async def test_sync(
         self,
         client: AsyncClient,
         db_session: AsyncSession,
         superuser_token_headers: dict,
         test_site: Site,
-        test_user: User,
+        full_sync: bool,
+        expected_active: set[str],
+        expected_removed: set[str],
     ):
-        """Test that partial sync (full_sync=False) keeps all existing modules."""
-        # Create some existing modules
-        module1 = await crud.crud_module.create_module(
-            db_session,
-            ModuleCreate(
-                machine_name="partial_module_1",
-                display_name="Partial Module 1",
-                module_type="contrib",
-            ),
-            test_user.id,
-        )
-
-        module2 = await crud.crud_module.create_module(
-            db_session,
-            ModuleCreate(
-                machine_name="partial_module_2",
-                display_name="Partial Module 2",
-                module_type="contrib",
-            ),
-            test_user.id,
-        )
-
-        # Create versions
-        version1 = await crud.crud_module_version.create_module_version(
-            db_session,
-            ModuleVersionCreate(module_id=module1.id, version_string="1.0.0"),
-            test_user.id,
-        )
-
-        version2 = await crud.crud_module_version.create_module_version(
-            db_session,
-            ModuleVersionCreate(module_id=module2.id, version_string="1.0.0"),
-            test_user.id,
-        )
-
-        # Associate with site
-        await crud.crud_site_module.create_site_module(
-            db_session,
-            SiteModuleCreate(
-                site_id=test_site.id,
-                module_id=module1.id,
-                current_version_id=version1.id,
-                enabled=True,
-            ),
-            test_user.id,
-        )
-
-        await crud.crud_site_module.create_site_module(
-            db_session,
-            SiteModuleCreate(
-                site_id=test_site.id,
-                module_id=module2.id,
-                current_version_id=version2.id,
-                enabled=True,
-            ),
-            test_user.id,
-        )
-
-        # Perform partial sync with only one module
+        """Test that only a full sync removes modules missing from the payload."""
+        # Sync with only module 1 of the two installed modules
         payload = {
             "site": {
                 "url": test_site.url,
                 "name": test_site.name,
                 "token": "test-token",
             },
-            "drupal_info": {
-                "core_version": "10.3.8",
-                "php_version": "8.3.2",
-                "ip_address": "192.168.1.100",
-            },
-            "modules": [
-                {
-                    "machine_name": "partial_module_1",
-                    "display_name": "Partial Module 1",
-                    "module_type": "contrib",
-                    "enabled": True,
-                    "version": "1.0.0",
-                }
-            ],
-            "full_sync": False,  # Partial sync
+            "drupal_info": SYNC_DRUPAL_INFO,
+            "modules": SYNC_MODULES,
+            "full_sync": full_sync,
         }
 
         response = await client.post(
@@ -231,11 +202,11 @@ class TestFullSync:
 
         assert response.status_code == 200
 
-        # Check that both modules are still associated
-        modules_after, _ = await crud.crud_site_module.get_site_modules(
-            db_session, site_id=test_site.id
+        # Removed modules are soft deleted, so list them alongside the active ones
+        site_modules, _ = await crud.crud_site_module.get_site_modules(
+            db_session, site_id=test_site.id, include_deleted=True
         )
-        assert len(modules_after) == 2
-        module_names = {m.module.machine_name for m in modules_after}
-        assert "partial_module_1" in module_names
-        assert "partial_module_2" in module_names
+        active = {m.module.machine_name for m in site_modules if not m.is_deleted}
+        removed = {m.module.machine_name for m in site_modules if m.is_deleted}
+        assert active == expected_active
+        assert removed == expected_removed
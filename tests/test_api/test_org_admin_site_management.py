@@ -1,70 +1,20 @@
 """Test org_admin site management permissions"""
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.core.security import get_password_hash
 from app.models.organization import Organization
-from app.models.role import Role, UserRole
 from app.models.site import Site
 from app.models.user import User
-from app.models.user_organization import user_organization
 
 
 @pytest.mark.asyncio
 async def test_org_admin_can_create_site_in_their_organization(
     client: AsyncClient,
-    db_session: AsyncSession,
-    test_organization: Organization
+    test_organization: Organization,
+    org_admin_headers: dict,
 ):
     """Test that org_admin can create sites in their organization"""
-    # Create a user with org_admin role
-    user = User(
-        email="siteadmin@example.com",
-        full_name="Site Admin",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "siteadmin@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-    
     # Create a site
     site_data = {
         "name": "Test Site",
@@ -75,7 +25,7 @@ async def test_org_admin_can_create_site_in_their_organization(
     response = await client.post(
         "/api/v1/sites/",
         json=site_data,
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Check if site creation is allowed
@@ -95,7 +45,8 @@ async def test_org_admin_can_view_sites_in_their_organization(
     client: AsyncClient,
     db_session: AsyncSession,
     test_organization: Organization,
-    test_user: User
+    test_user: User,
+    org_admin_headers: dict,
 ):
     """Test that org_admin can view sites in their organization"""
     # Create a site in the organization
@@ -110,57 +61,11 @@ async def test_org_admin_can_view_sites_in_their_organization(
     )
     db_session.add(site)
     await db_session.commit()
-    await db_session.refresh(site)
-    
-    # Create org_admin user
-    user = User(
-        email="siteviewer@example.com",
-        full_name="Site Viewer",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "siteviewer@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
     
     # Get organization sites
     response = await client.get(
         f"/api/v1/organizations/{test_organization.id}/sites",
-        headers=headers
+        headers=org_admin_headers
     )
     
     assert response.status_code == 200
@@ -174,7 +79,8 @@ async def test_org_admin_cannot_create_site_in_other_organization(
     client: AsyncClient,
     db_session: AsyncSession,
     test_organization: Organization,
-    test_user: User
+    test_user: User,
+    org_admin_headers: dict,
 ):
     """Test that org_admin cannot create sites in other organizations"""
     # Create another organization
@@ -187,52 +93,6 @@ async def test_org_admin_cannot_create_site_in_other_organization(
     )
     db_session.add(other_org)
     await db_session.commit()
-    await db_session.refresh(other_org)
-    
-    # Create org_admin user for test_organization
-    user = User(
-        email="limitedsiteadmin@example.com",
-        full_name="Limited Site Admin",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role for test_organization
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "limitedsiteadmin@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
     
     # Try to create a site in OTHER organization
     site_data = {
@@ -244,7 +104,7 @@ async def test_org_admin_cannot_create_site_in_other_organization(
     response = await client.post(
         "/api/v1/sites/",
         json=site_data,
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Should fail with 403 or 422 (validation error)
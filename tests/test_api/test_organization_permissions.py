@@ -1,71 +1,20 @@
 """Test organization permissions using RBAC"""
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.core.security import get_password_hash, create_access_token
 from app.models.organization import Organization
-from app.models.role import Role, UserRole
 from app.models.user import User
-from app.models.user_organization import user_organization
+from tests.test_api._org_members import provision_org_member, token_headers
 
 
 @pytest.mark.asyncio
 async def test_org_admin_can_update_organization(
     client: AsyncClient,
-    db_session: AsyncSession,
-    test_organization: Organization
+    test_organization: Organization,
+    org_admin_headers: dict,
 ):
     """Test that org_admin can update their organization"""
-    # Create a user with proper password hash
-    user = User(
-        email="orgadmin@example.com",
-        full_name="Org Admin",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    assert org_admin_role is not None, "org_admin role should exist"
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "orgadmin@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-    
     # Try to update the organization
     update_data = {
         "name": "Updated Organization Name",
@@ -75,7 +24,7 @@ async def test_org_admin_can_update_organization(
     response = await client.put(
         f"/api/v1/organizations/{test_organization.id}",
         json=update_data,
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Should succeed if permissions are working
@@ -92,36 +41,16 @@ async def test_non_org_admin_cannot_update_organization(
     test_organization: Organization
 ):
     """Test that non-org_admin users cannot update organizations"""
-    # Create a regular user
-    user = User(
-        email="regular@example.com",
-        full_name="Regular User",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
+    # Create a regular member
+    user = await provision_org_member(
+        db_session,
+        test_organization,
+        "regular@example.com",
+        "Regular User",
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
     
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Login as regular user
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "regular@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
+    # Sign a token for the regular user instead of logging in
+    headers = token_headers(user)
     
     # Try to update the organization
     update_data = {
@@ -142,59 +71,14 @@ async def test_non_org_admin_cannot_update_organization(
 @pytest.mark.asyncio
 async def test_org_admin_can_delete_own_organization(
     client: AsyncClient,
-    db_session: AsyncSession,
-    test_organization: Organization
+    test_organization: Organization,
+    org_admin_headers: dict,
 ):
     """Test that org_admin can delete their organization"""
-    # Create a user with org_admin role
-    user = User(
-        email="orgadmin2@example.com",
-        full_name="Org Admin 2",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "orgadmin2@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-    
     # Try to delete the organization
     response = await client.delete(
         f"/api/v1/organizations/{test_organization.id}",
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Should succeed if permissions are working
@@ -209,7 +93,8 @@ async def test_org_admin_cannot_access_other_organizations(
     client: AsyncClient,
     db_session: AsyncSession,
     test_organization: Organization,
-    test_user: User
+    test_user: User,
+    org_admin_headers: dict,
 ):
     """Test that org_admin cannot access organizations they don't belong to"""
     # Create another organization
@@ -222,52 +107,6 @@ async def test_org_admin_cannot_access_other_organizations(
     )
     db_session.add(other_org)
     await db_session.commit()
-    await db_session.refresh(other_org)
-    
-    # Create org_admin user for test_organization
-    user = User(
-        email="orgadmin3@example.com",
-        full_name="Org Admin 3",
-        hashed_password=get_password_hash("test123"),
-        is_active=True,
-        organization_id=test_organization.id
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    
-    # Add user-organization association
-    await db_session.execute(
-        user_organization.insert().values(
-            user_id=user.id,
-            organization_id=test_organization.id,
-            is_default=True
-        )
-    )
-    await db_session.commit()
-    
-    # Assign org_admin role
-    role_query = select(Role).where(Role.name == "org_admin")
-    result = await db_session.execute(role_query)
-    org_admin_role = result.scalar_one_or_none()
-    
-    user_role = UserRole.assign_role(
-        user_id=user.id,
-        role_id=org_admin_role.id,
-        organization_id=test_organization.id,
-        assigned_by_id=user.id
-    )
-    db_session.add(user_role)
-    await db_session.commit()
-    
-    # Login as org_admin
-    response = await client.post(
-        "/api/v1/auth/access-token",
-        data={"username": "orgadmin3@example.com", "password": "test123"}
-    )
-    assert response.status_code == 200
-    token = response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
     
     # Try to update the OTHER organization
     update_data = {
@@ -278,7 +117,7 @@ async def test_org_admin_cannot_access_other_organizations(
     response = await client.put(
         f"/api/v1/organizations/{other_org.id}",
         json=update_data,
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Should fail with 403 Forbidden
@@ -287,8 +126,8 @@ async def test_org_admin_cannot_access_other_organizations(
     # Try to delete the OTHER organization
     response = await client.delete(
         f"/api/v1/organizations/{other_org.id}",
-        headers=headers
+        headers=org_admin_headers
     )
     
     # Should fail with 403 Forbidden
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
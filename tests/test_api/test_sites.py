@@ -156,18 +156,22 @@ async def test_get_organization_sites(
     await db_session.execute(stmt)
     await db_session.commit()
 
-    # Create multiple test sites using CRUD
-    from app.schemas.site import SiteCreate
-
-    sites = []
-    for i in range(3):
-        site_in = SiteCreate(
-            name=f"Org Site {i}",
-            url=f"https://site{i}.example.com",
-            organization_id=test_organization.id,
-        )
-        site = await crud.create_site(db_session, site_in, test_user.id)
-        sites.append(site)
+    # Create multiple test sites in a single flush
+    from app.models.site import Site
+
+    db_session.add_all(
+        [
+            Site(
+                name=f"Org Site {i}",
+                url=f"https://site{i}.example.com/",
+                organization_id=test_organization.id,
+                created_by=test_user.id,
+                updated_by=test_user.id,
+            )
+            for i in range(3)
+        ]
+    )
+    await db_session.flush()
 
     response = await client.get(
         f"/api/v1/organizations/{test_organization.id}/sites",
@@ -97,6 +97,28 @@ class TestModuleCRUD:
         assert module.is_covered is False
         assert module.created_by == test_user.id
 
+    async def test_bulk_create_modules(self, db_session: AsyncSession, test_user):
+        """Test creating several modules in one batch."""
+        modules_data = [
+            ModuleCreate(
+                machine_name=f"bulk_module_{i}",
+                display_name=f"Bulk Module {i}",
+                module_type="contrib",
+            )
+            for i in range(3)
+        ]
+
+        module_ids = await crud_module.bulk_create_modules(
+            db_session, modules=modules_data, created_by=test_user.id
+        )
+        await db_session.commit()
+
+        assert len(module_ids) == 3
+        for i, module_id in enumerate(module_ids):
+            module = await crud_module.get_module(db_session, module_id)
+            assert module.machine_name == f"bulk_module_{i}"
+            assert module.created_by == test_user.id
+
     async def test_update_module(self, db_session: AsyncSession, test_module):
         """Test updating a module."""
         # test_module starts with is_covered=True
@@ -0,0 +1,57 @@
+"""Tests for module version CRUD operations."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import crud_module_version
+from app.models.module import Module
+from app.schemas.module_version import ModuleVersionCreate
+
+
+class TestModuleVersionCRUD:
+    """Test cases for ModuleVersion CRUD operations."""
+
+    @pytest.fixture
+    async def test_module(self, db_session: AsyncSession, test_user):
+        """Create a module for the versions to belong to."""
+        module = Module(
+            machine_name="versioned_module",
+            display_name="Versioned Module",
+            module_type="contrib",
+            created_by=test_user.id,
+            updated_by=test_user.id,
+        )
+        db_session.add(module)
+        await db_session.commit()
+        await db_session.refresh(module)
+        return module
+
+    async def test_bulk_create_module_versions(
+        self, db_session: AsyncSession, test_user, test_module
+    ):
+        """Test creating several module versions in one batch."""
+        versions_data = [
+            ModuleVersionCreate(
+                module_id=test_module.id,
+                version_string=f"1.{i}.0",
+                is_security_update=i == 1,
+                drupal_core_compatibility=["10.x", "11.x"],
+            )
+            for i in range(3)
+        ]
+
+        version_ids = await crud_module_version.bulk_create_module_versions(
+            db_session, versions=versions_data, created_by=test_user.id
+        )
+        await db_session.commit()
+
+        assert len(version_ids) == 3
+        for i, version_id in enumerate(version_ids):
+            version = await crud_module_version.get_module_version(
+                db_session, version_id
+            )
+            assert version.module_id == test_module.id
+            assert version.version_string == f"1.{i}.0"
+            assert version.is_security_update is (i == 1)
+            assert version.drupal_core_compatibility == "10.x,11.x"
+            assert version.created_by == test_user.id
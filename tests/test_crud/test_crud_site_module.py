@@ -0,0 +1,74 @@
+"""Tests for site module CRUD operations."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import crud_site_module
+from app.models.module import Module
+from app.models.module_version import ModuleVersion
+from app.schemas.site_module import SiteModuleCreate
+
+
+class TestSiteModuleCRUD:
+    """Test cases for SiteModule CRUD operations."""
+
+    @pytest.fixture
+    async def test_versions(self, db_session: AsyncSession, test_user):
+        """Create three modules with one version each."""
+        modules = [
+            Module(
+                machine_name=f"site_module_{i}",
+                display_name=f"Site Module {i}",
+                module_type="contrib",
+                created_by=test_user.id,
+                updated_by=test_user.id,
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(modules)
+        await db_session.flush()
+
+        versions = [
+            ModuleVersion(
+                module_id=module.id,
+                version_string="1.0.0",
+                created_by=test_user.id,
+                updated_by=test_user.id,
+            )
+            for module in modules
+        ]
+        db_session.add_all(versions)
+        await db_session.commit()
+        return versions
+
+    async def test_bulk_create_site_modules(
+        self, db_session: AsyncSession, test_user, test_site, test_versions
+    ):
+        """Test creating several site modules in one batch."""
+        site_modules_data = [
+            SiteModuleCreate(
+                site_id=test_site.id,
+                module_id=version.module_id,
+                current_version_id=version.id,
+                enabled=i != 1,
+            )
+            for i, version in enumerate(test_versions)
+        ]
+
+        site_module_ids = await crud_site_module.bulk_create_site_modules(
+            db_session, site_modules=site_modules_data, created_by=test_user.id
+        )
+        await db_session.commit()
+
+        assert len(site_module_ids) == 3
+        for i, (site_module_id, version) in enumerate(
+            zip(site_module_ids, test_versions)
+        ):
+            site_module = await crud_site_module.get_site_module(
+                db_session, site_module_id
+            )
+            assert site_module.site_id == test_site.id
+            assert site_module.module_id == version.module_id
+            assert site_module.current_version_id == version.id
+            assert site_module.enabled is (i != 1)
+            assert site_module.created_by == test_user.id